@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import os, subprocess, sys
+import os, sys
 
 appdir = os.path.dirname(os.path.realpath(__file__))
 
@@ -19,4 +19,5 @@ except Exception as e:
     )
     sys.exit(127)
 
-sys.exit(subprocess.call([sys.executable, f"{appdir}/usr/bin/app.py"] + sys.argv[1:]))
+app = f"{appdir}/usr/bin/app.py"
+os.execv(sys.executable, [sys.executable, app] + sys.argv[1:])